@@ -1,34 +1,59 @@
 """Fabman API client mit Pagination."""
 import logging
-from urllib.parse import urljoin
+from urllib.parse import urlencode, urljoin
+from .const import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 _LOGGER = logging.getLogger(__name__)
 
 class FabmanAPI:
-    def __init__(self, session, base_url, api_key):
+    def __init__(self, session, base_url, api_key, page_size=DEFAULT_PAGE_SIZE):
         # Entferne einen eventuellen Trailing Slash
         self._session = session
         self._base_url = base_url.rstrip("/")
         # Der API-Key wird als Bearer-Token übergeben:
         self._headers = {"Authorization": f"Bearer {api_key}"}
+        # Konfigurierte Seitengröße dient als Untergrenze, die aktuelle wird automatisch angepasst
+        self._min_page_size = min(max(int(page_size), 1), MAX_PAGE_SIZE)
+        self._page_size = self._min_page_size
+        self._max_page_size = MAX_PAGE_SIZE
 
     @property
     def base_url(self):
         """Gibt den Basis-URL zurück."""
         return self._base_url
-    
-    async def get_resources(self):
-        """Rufe alle Ressourcen (mit Pagination) ab."""
-        resources = []
-        url = f"{self._base_url}/resources?limit=50&embed=bridge"
 
+    @property
+    def page_size(self):
+        """Gibt die aktuell verwendete Seitengröße zurück."""
+        return self._page_size
+
+    async def get_resources(self, embed=("bridge",)):
+        """
+        Rufe alle Ressourcen (mit Pagination) ab.
+        Mit embed=() werden keine eingebetteten Objekte (z. B. Bridge) mitgeladen,
+        was für die häufigen Status-Polls ausreicht.
+        """
+        resources = []
+        params = {"limit": self._page_size}
+        if embed:
+            params["embed"] = ",".join(embed)
+        url = f"{self._base_url}/resources?{urlencode(params)}"
+        requests = 0
 
         while url:
             _LOGGER.debug("Fabman API Request: %s", url)
+            requests += 1
             async with self._session.get(url, headers=self._headers) as response:
                 if response.status != 200:
                     text = await response.text()
                     _LOGGER.error("Error calling %s: %s - %s", url, response.status, text)
+                    # Falls eine vergrößerte Seitengröße abgelehnt wird: auf die konfigurierte
+                    # Seitengröße zurückfallen und nicht erneut vergrößern
+                    if self._page_size > self._min_page_size:
+                        _LOGGER.warning("Seitengröße %s zurückgesetzt auf %s",
+                                        self._page_size, self._min_page_size)
+                        self._page_size = self._min_page_size
+                        self._max_page_size = self._min_page_size
                     raise Exception(f"Error fetching resources: {response.status}")
 
                 data = await response.json()
@@ -52,4 +77,9 @@ class FabmanAPI:
                     
                 url = next_url
 
+        # Seitengröße an die Anzahl der Ressourcen anpassen, damit der nächste Abruf mit einem Request auskommt
+        self._page_size = min(max(len(resources), self._min_page_size), self._max_page_size)
+        _LOGGER.debug("%s Ressourcen in %s Requests geladen, neue Seitengröße: %s",
+                      len(resources), requests, self._page_size)
+
         return resources
@@ -6,9 +6,12 @@ from .const import (
     CONF_API_URL,
     CONF_ENABLE_PERIODIC_SYNC,
     CONF_POLL_INTERVAL,
+    CONF_PAGE_SIZE,
     DEFAULT_API_URL,
     DEFAULT_ENABLE_PERIODIC_SYNC,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
 )
 
 class FabmanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -27,5 +30,7 @@ class FabmanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Optional(CONF_ENABLE_PERIODIC_SYNC, default=DEFAULT_ENABLE_PERIODIC_SYNC): bool,
             vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL):
                 vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+            vol.Optional(CONF_PAGE_SIZE, default=DEFAULT_PAGE_SIZE):
+                vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_PAGE_SIZE)),
         })
         return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
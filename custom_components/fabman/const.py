@@ -5,8 +5,12 @@ CONF_API_TOKEN = "api_token"
 CONF_API_URL = "api_url"
 CONF_ENABLE_PERIODIC_SYNC = "enable_periodic_sync"
 CONF_POLL_INTERVAL = "poll_interval"
+CONF_PAGE_SIZE = "page_size"
 
 # Standardwerte
 DEFAULT_API_URL = "https://fabman.io/api/v1"
 DEFAULT_ENABLE_PERIODIC_SYNC = True
 DEFAULT_POLL_INTERVAL = 30  # Standardintervall in Sekunden
+DEFAULT_PAGE_SIZE = 50  # Start-Seitengröße, wird automatisch an die Anzahl der Ressourcen angepasst
+MAX_PAGE_SIZE = 1000  # Selbst gewählte Obergrenze für "limit" (kein dokumentiertes Limit der Fabman API)
+FULL_REFRESH_INTERVAL = 3600  # Sekunden zwischen zwei vollständigen Abrufen (inkl. eingebetteter Bridge)
@@ -5,8 +5,10 @@ from datetime import timedelta
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.util.dt as dt_util
 #from .const import UPDATE_INTERVAL, CONF_API_TOKEN, CONF_API_URL, CONF_WEBSOCKET_URL, CONF_ENABLE_PERIODIC_SYNC, CONF_POLL_INTERVAL
 from .const import CONF_API_TOKEN, CONF_API_URL, CONF_ENABLE_PERIODIC_SYNC, CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL #, CONF_WEBSOCKET_URL
+from .const import CONF_PAGE_SIZE, DEFAULT_PAGE_SIZE, FULL_REFRESH_INTERVAL
 from .api import FabmanAPI
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,7 +23,10 @@ class FabmanDataUpdateCoordinator(DataUpdateCoordinator):
         #self.websocket_url = config.get(CONF_WEBSOCKET_URL)
         self.enable_periodic_sync = config.get(CONF_ENABLE_PERIODIC_SYNC)
         self.poll_interval = config.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL) 
+        self.page_size = config.get(CONF_PAGE_SIZE, DEFAULT_PAGE_SIZE)
         self._session = async_get_clientsession(self.hass)
+        self._api = None
+        self._last_full_refresh = None  # Zeitpunkt des letzten vollständigen Abrufs
         #self._websocket_task = None
         update_interval = timedelta(seconds=self.poll_interval) if self.enable_periodic_sync else None
 
@@ -36,15 +41,45 @@ class FabmanDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.data = {}  # Speichert die Ressourcen, key ist die resource id
 
+    def _get_api(self):
+        """Gibt den API-Client zurück (wird beim ersten Abruf erstellt)."""
+        # Eine Instanz wiederverwenden, damit die automatisch angepasste Seitengröße erhalten bleibt
+        if self._api is None:
+            self._api = FabmanAPI(self._session, self.api_url, self.api_token, self.page_size)
+        return self._api
+
+    def _full_refresh_due(self):
+        """Prüft, ob ein vollständiger Abruf (inkl. eingebetteter Bridge) fällig ist."""
+        if not self.data or self._last_full_refresh is None:
+            return True
+        return dt_util.utcnow() - self._last_full_refresh >= timedelta(seconds=FULL_REFRESH_INTERVAL)
+
     async def _async_update_data(self):
         try:
-            fabman_api = FabmanAPI(self._session, self.api_url, self.api_token)
+            fabman_api = self._get_api()
+
+            if not self._full_refresh_due():
+                # Häufiger Poll: Ressourcen ohne eingebettete Bridge abrufen,
+                # die Bridge stammt aus dem letzten vollständigen Abruf
+                resources = await fabman_api.get_resources(embed=())
+                new_data = {r.get("id"): r for r in resources if r.get("id")}
+
+                # Neue oder entfernte Ressourcen erfordern einen vollständigen Abruf
+                if new_data.keys() == self.data.keys():
+                    for resource_id, resource in new_data.items():
+                        embedded = self.data[resource_id].get("_embedded")
+                        if embedded is not None:
+                            resource["_embedded"] = embedded
+                    return new_data
+                _LOGGER.debug("Ressourcenliste hat sich geändert, starte vollständigen Abruf")
+
             resources = await fabman_api.get_resources()
             new_data = {}
             for resource in resources:
                 resource_id = resource.get("id")
                 if resource_id:
                     new_data[resource_id] = resource
+            self._last_full_refresh = dt_util.utcnow()
             return new_data
         except Exception as e:
             raise UpdateFailed(f"Exception beim Datenabruf: {e}")
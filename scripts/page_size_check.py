@@ -0,0 +1,78 @@
+"""
+Prüft die automatische Anpassung der Seitengröße in FabmanAPI.get_resources.
+
+Gegen den Fake-Server aus webhook_loadtest.py, der zu große "limit"-Werte
+ablehnt, wird geprüft:
+  - die Seitengröße wächst nach einem erfolgreichen Abruf auf die Anzahl der Ressourcen
+  - wird die vergrößerte Seitengröße abgelehnt, fällt sie auf die konfigurierte zurück
+  - danach funktionieren die Abrufe wieder und die Seitengröße wächst nicht erneut
+
+Aufruf aus dem Repository-Root:
+  python scripts/page_size_check.py
+Exit-Code 0 bei Erfolg, sonst 1.
+"""
+import asyncio
+import sys
+
+import aiohttp
+
+from webhook_loadtest import FakeFabmanAPI
+
+from custom_components.fabman.api import FabmanAPI
+
+RESOURCE_COUNT = 120
+PAGE_SIZE = 50
+MAX_LIMIT = 100
+
+
+async def run_check():
+    """Führt die Prüfung aus und gibt eine Liste der Fehler zurück."""
+    errors = []
+    api = FakeFabmanAPI(RESOURCE_COUNT, max_limit=MAX_LIMIT)
+    await api.start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            fabman_api = FabmanAPI(session, api.url, "check", PAGE_SIZE)
+
+            # 1. Abruf mit konfigurierter Seitengröße, danach vergrößert
+            resources = await fabman_api.get_resources()
+            if len(resources) != RESOURCE_COUNT or api.requests != 3:
+                errors.append(f"Erster Abruf: {len(resources)} Ressourcen in {api.requests} Requests")
+            if fabman_api.page_size != RESOURCE_COUNT:
+                errors.append(f"Seitengröße nicht vergrößert: {fabman_api.page_size}")
+
+            # 2. Vergrößerte Seitengröße wird abgelehnt
+            try:
+                await fabman_api.get_resources()
+                errors.append("Zu große Seitengröße wurde nicht abgelehnt")
+            except Exception:
+                pass
+            if fabman_api.page_size != PAGE_SIZE:
+                errors.append(f"Seitengröße nicht zurückgesetzt: {fabman_api.page_size}")
+
+            # 3. und 4. Abruf funktionieren wieder mit der konfigurierten Seitengröße
+            for attempt in (3, 4):
+                try:
+                    resources = await fabman_api.get_resources()
+                    if len(resources) != RESOURCE_COUNT:
+                        errors.append(f"Abruf {attempt}: {len(resources)} Ressourcen")
+                except Exception as e:
+                    errors.append(f"Abruf {attempt} fehlgeschlagen: {e}")
+            if fabman_api.page_size != PAGE_SIZE:
+                errors.append(f"Seitengröße nach Fehler erneut vergrößert: {fabman_api.page_size}")
+    finally:
+        await api.stop()
+    return errors
+
+
+def main():
+    errors = asyncio.run(run_check())
+    for error in errors:
+        print(f"❌ {error}")
+    if not errors:
+        print("✅ Seitengröße: Vergrößern und Zurückfallen korrekt")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+Lasttest für den Fabman Webhook-Endpoint.
+
+Feuert N gleichzeitige, synthetische Fabman-Webhooks ("Activity Log") über
+async_handle_webhook der Webhook-Komponente auf den mit async_register
+registrierten handle_webhook ab. Die Fabman API wird dabei durch einen lokalen
+Fake-Server ersetzt, der Test läuft also komplett offline. Die Events werden
+über ein Zeitfenster (--spread) verteilt, sodass Änderungen in der Fake-API und
+laufende Webhook-Refreshes sich überschneiden.
+
+Ausgewertet werden:
+  - p50/p99 Latenz bis zur Webhook-Antwort (ohne HTTP-Server, die Requests
+    werden als MockRequest direkt an den Webhook-Dispatch übergeben)
+  - API-Requests pro Event
+  - Timer-Churn in FABMAN_TIMERS (erstellt / abgebrochen / aktiv)
+  - Korrektheit des Endzustands (Coordinator-Daten == Fake-API)
+
+Der Endzustand wird direkt nach dem Sturm geprüft, also so, wie ihn
+handle_webhook hinterlässt (ohne zusätzlichen Refresh).
+
+Aufruf aus dem Repository-Root:
+  python scripts/webhook_loadtest.py --events 200 --doors 20 --spread 0.5
+Exit-Code 0 bei korrektem Endzustand, sonst 1.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import homeassistant.util.dt as dt_util
+from homeassistant.components.webhook import async_handle_webhook, async_register
+from homeassistant.core import HomeAssistant
+from homeassistant.util.aiohttp import MockRequest
+
+from custom_components.fabman import FABMAN_TIMERS, WEBHOOK_ID, handle_webhook
+from custom_components.fabman.const import (
+    DOMAIN,
+    CONF_API_TOKEN,
+    CONF_API_URL,
+    CONF_ENABLE_PERIODIC_SYNC,
+)
+from custom_components.fabman.coordinator import FabmanDataUpdateCoordinator
+
+MAX_OFFLINE_USAGE = 60  # Sekunden, die eine Tür nach dem Öffnen als "on" gilt
+
+
+class FakeFabmanAPI:
+    """Minimaler Fabman API-Server mit Pagination über den Link-Header."""
+
+    def __init__(self, door_count, max_limit=None):
+        self.requests = 0
+        self.max_limit = max_limit  # Größere "limit"-Werte werden mit HTTP 400 abgelehnt
+        self.resources = {}
+        for resource_id in range(1, door_count + 1):
+            self.resources[resource_id] = {
+                "id": resource_id,
+                "account": 1,
+                "name": f"Tür {resource_id}",
+                "controlType": "door",
+                "maxOfflineUsage": MAX_OFFLINE_USAGE,
+                "lastUsed": None,
+                "_embedded": {"bridge": {"id": 1000 + resource_id}},
+            }
+        self._runner = None
+        self.url = None
+
+    def open_door(self, resource_id, log_id):
+        """Simuliert ein Öffnen der Tür und gibt den Webhook-Payload dafür zurück."""
+        now = dt_util.utcnow().isoformat()
+        resource = self.resources[resource_id]
+        resource["lastUsed"] = {"id": log_id, "at": now, "stopType": None}
+        return {
+            "type": "resourceLog_created",
+            "details": {
+                "resource": {key: value for key, value in resource.items() if key != "_embedded"},
+                "log": {"id": log_id, "createdAt": now},
+            },
+        }
+
+    async def _handle_resources(self, request):
+        self.requests += 1
+        limit = int(request.query.get("limit", 50))
+        offset = int(request.query.get("offset", 0))
+        embed = request.query.get("embed", "")
+        if self.max_limit is not None and limit > self.max_limit:
+            return web.json_response({"error": f"limit must be <= {self.max_limit}"}, status=400)
+
+        page = []
+        for resource in list(self.resources.values())[offset:offset + limit]:
+            resource = dict(resource)
+            if "bridge" not in embed:
+                resource.pop("_embedded")
+            page.append(resource)
+
+        headers = {}
+        if offset + limit < len(self.resources):
+            query = dict(request.query, offset=str(offset + limit))
+            next_url = request.url.with_query(query)
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return web.json_response(page, headers=headers)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/api/v1/resources", self._handle_resources)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}/api/v1"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+def percentile(values, percent):
+    """Perzentil per Nearest-Rank."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_loadtest(events, door_count, spread=0.5, seed=0):
+    """Führt den Lasttest aus und gibt die Kennzahlen als Dictionary zurück."""
+    rng = random.Random(seed)
+    api = FakeFabmanAPI(door_count)
+    await api.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            coordinator = FabmanDataUpdateCoordinator(hass, {
+                CONF_API_TOKEN: "loadtest",
+                CONF_API_URL: api.url,
+                CONF_ENABLE_PERIODIC_SYNC: False,
+            })
+            await coordinator.async_refresh()
+            hass.data.setdefault(DOMAIN, {})["loadtest"] = coordinator
+            async_register(hass, DOMAIN, "Fabman Webhook", WEBHOOK_ID, handle_webhook)
+            setup_requests = api.requests
+
+            latencies = []
+            statuses = []
+            seen_timers = set()
+
+            async def fire(log_id, delay, resource_id):
+                # Events zeitlich verteilen, damit sie sich mit laufenden Refreshes überschneiden
+                await asyncio.sleep(delay)
+                # Event in der Fake-API auslösen, danach den Webhook zustellen
+                payload = api.open_door(resource_id, log_id)
+                request = MockRequest(
+                    content=json.dumps(payload).encode(),
+                    mock_source="fabman_loadtest",
+                    method="POST",
+                )
+                start = time.perf_counter()
+                response = await async_handle_webhook(hass, WEBHOOK_ID, request)
+                latencies.append(time.perf_counter() - start)
+                statuses.append(response.status)
+                seen_timers.update(hass.data.get(FABMAN_TIMERS, {}).values())
+
+            await asyncio.gather(*(
+                fire(log_id, rng.uniform(0, spread), rng.randint(1, door_count))
+                for log_id in range(1, events + 1)
+            ))
+
+            # Endzustand so prüfen, wie ihn die Webhooks hinterlassen haben
+            timers = hass.data.get(FABMAN_TIMERS, {})
+            expected = {resource_id: resource["lastUsed"] for resource_id, resource in api.resources.items()}
+            actual = {resource_id: resource.get("lastUsed") for resource_id, resource in coordinator.data.items()}
+            used_doors = {resource_id for resource_id, last_used in expected.items() if last_used}
+
+            result = {
+                "events": events,
+                "doors": door_count,
+                "errors": sum(1 for status in statuses if status != 200),
+                "p50_ms": percentile(latencies, 50) * 1000,
+                "p99_ms": percentile(latencies, 99) * 1000,
+                "api_calls_per_event": (api.requests - setup_requests) / events,
+                "timers_created": len(seen_timers),
+                "timers_cancelled": sum(1 for timer in seen_timers if timer.cancelled()),
+                "timers_active": sum(1 for timer in timers.values() if not timer.cancelled()),
+                "state_correct": actual == expected and set(timers) == used_doors,
+            }
+
+            for timer in timers.values():
+                timer.cancel()
+            return result
+        finally:
+            await hass.async_stop(force=True)
+            await api.stop()
+
+
+def positive_int(value):
+    """argparse-Typ für ganze Zahlen >= 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"muss mindestens 1 sein: {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lasttest für den Fabman Webhook-Endpoint.")
+    parser.add_argument("--events", type=positive_int, default=200, help="Anzahl gleichzeitiger Webhooks")
+    parser.add_argument("--doors", type=positive_int, default=20, help="Anzahl simulierter Türen")
+    parser.add_argument("--spread", type=float, default=0.5,
+                        help="Zeitfenster in Sekunden, über das die Events verteilt werden")
+    parser.add_argument("--seed", type=int, default=0, help="Seed für die Verteilung der Events")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_loadtest(args.events, args.doors, args.spread, args.seed))
+    print(f"Events:               {result['events']} auf {result['doors']} Türen")
+    print(f"Fehler:               {result['errors']}")
+    print(f"Latenz p50 / p99:     {result['p50_ms']:.1f} ms / {result['p99_ms']:.1f} ms")
+    print(f"API-Requests/Event:   {result['api_calls_per_event']:.2f}")
+    print(f"Timer erstellt:       {result['timers_created']}")
+    print(f"Timer abgebrochen:    {result['timers_cancelled']}")
+    print(f"Timer aktiv:          {result['timers_active']}")
+    print(f"Endzustand korrekt:   {'ja' if result['state_correct'] else 'NEIN'}")
+    return 0 if result["state_correct"] and not result["errors"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())